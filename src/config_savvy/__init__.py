@@ -3,9 +3,11 @@ from __future__ import annotations
 import configparser
 import logging
 import os
+import sys
+import weakref
+from types import MappingProxyType
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from typing import List, Callable, Dict, Union, Tuple, Any, Set
+from typing import List, Callable, Dict, Union, Tuple, Any, Set, FrozenSet, Optional, Iterable, Iterator
 
 LOGGER = logging.getLogger('config_savvy')
 
@@ -41,10 +43,21 @@ class NoDirectResolversError(ConfigError):
 
 
 class UnsetParameter:
-    pass
+    __slots__ = ()
+
+
+def _intern(value):
+    # section names are dict keys everywhere, interned ones compare by identity
+    # sys.intern only takes exact str, subclasses such as str enums pass through
+    return sys.intern(value) if type(value) is str else value
 
 
 class Option:
+    __slots__ = (
+        '_name', '_name_upper', '_processor', '_default', '_section', '_value', '_resolved',
+        'description', '_resolver', 'attempts', '_hash', '_cache_enabled', '_cached',
+        '_default_factory', '_processed'
+    )
 
     def __init__(
             self,
@@ -55,21 +68,98 @@ class Option:
             processor: Callable = None,
             section: str = UnsetParameter,
             description: str = None,
-            resolver: Config = None
+            resolver: Config = None,
+            cache: bool = True,
+            default_factory: Callable = None
     ):
-        super().__init__()
-        self.name = name
-        self._processor = processor or (lambda x: x)
+        if default is not UnsetParameter and default_factory is not None:
+            raise ConfigError(f'Option {name} can not have both a default and a default_factory')
+        self._set_name(name)
+        # None means the raw value is returned as is
+        self._processor = processor
+        # (raw, result) of the last processor call
+        self._processed = None
         self._default = default
-        self.section = section
+        # called at most once, only when no value could be resolved
+        self._default_factory = default_factory
+        self._section = _intern(section)
         self._value = value
         self._resolved = resolved
         self.description = description
-        self.resolver = resolver
+        self._resolver = resolver
+        self._rehash()
         self.attempts = []
+        # remember the first successfully read value
+        # with caching disabled every read asks the resolvers again, but
+        # resolvers keep their own copy of their source: after it changes
+        # call refresh() on them or Config.invalidate()
+        self._cache_enabled = cache
+        self._cached = UnsetParameter
 
     def __hash__(self):
-        return hash((self.name, self.section, self.resolver))
+        return self._hash
+
+    def __getstate__(self):
+        # string hashes differ between processes and cached values
+        # belong to the environment they were read in, neither is kept
+        return {
+            slot: getattr(self, slot)
+            for slot in self.__slots__
+            if slot not in ('_hash', '_cached', '_processed') and hasattr(self, slot)
+        }
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._set_name(self._name)
+        self._rehash()
+        self._cached = UnsetParameter
+        self._processed = None
+
+    def _rehash(self):
+        # the hash is computed once and refreshed only when its inputs change
+        self._hash = hash((self._name, self._section, self._resolver))
+
+    def _check_unbound(self, attribute: str):
+        # a bound option is indexed by (section, name) in its resolver
+        # changing either would leave it filed under a stale key
+        if self._resolver is not None and self._section is not UnsetParameter:
+            raise ConfigError(f'Can not change the {attribute} of {self} after it was bound')
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._check_unbound('name')
+        self._set_name(name)
+        self._rehash()
+
+    def _set_name(self, name: str):
+        # environment lookups use the uppercased name, computed once
+        # str subclasses such as str enums are kept as given
+        self._name = _intern(name)
+        self._name_upper = sys.intern(str.upper(name))
+
+    @property
+    def section(self) -> str:
+        return self._section
+
+    @section.setter
+    def section(self, section: str):
+        self._check_unbound('section')
+        self._section = _intern(section)
+        self._rehash()
+
+    @property
+    def resolver(self) -> Config:
+        return self._resolver
+
+    @resolver.setter
+    def resolver(self, resolver: Config):
+        self._resolver = resolver
+        self._rehash()
 
     def __eq__(self, other: Option):
         return self.section == other.section and self.name == other.name and self.resolver == other.resolver
@@ -79,24 +169,67 @@ class Option:
 
     def bind(self, resolver: OptionResolver):
         self.resolver = resolver
+        self._cached = UnsetParameter
+        return self
+
+    def invalidate(self):
+        # forget the cached value so the next read queries the resolvers again
+        self._cached = UnsetParameter
+        self._processed = None
+        if isinstance(self._resolver, Config):
+            self._resolver._hierarchy_changed()
         return self
 
     def read(self):
+        if self._cached is not UnsetParameter:
+            return self._cached
+
         if self._value is not UnsetParameter:
-            return self._processor(self._value)
+            return self._finish(self._value)
+
+        resolver = self._resolver
+        if isinstance(resolver, Config) and resolver._owns(self):
+            # a miss comes back as UnsetParameter, nothing is raised
+            resolved = resolver._lookup(self)
+            if resolved is not UnsetParameter:
+                self._resolved = resolved
+                return self._finish(resolved)
+        else:
+            try:
+                self.resolve()
+                if self._resolved is not UnsetParameter:
+                    return self._finish(self._resolved)
+            except (UnassignedOptionError, NoDirectResolversError):
+                pass
 
-        try:
-            self.resolve()
-            if self._resolved is not UnsetParameter:
-                return self._processor(self._resolved)
-        except (UnassignedOptionError, NoDirectResolversError):
-            pass
+        return self._read_default()
+
+    def _read_default(self):
+        # last resort, after the explicit value and the resolvers
+        if self._default_factory is not None:
+            self._default = self._default_factory()
+            self._default_factory = None
 
         if self._default is not UnsetParameter:
-            return self._processor(self._default)
+            return self._finish(self._default)
 
         raise UnassignedOptionError(f'Could not read value of {self.name}')
 
+    def _finish(self, raw):
+        # apply the processor and remember the outcome
+        if self._processor is None:
+            result = raw
+        elif self._processed is not None and self._processed[0] is raw:
+            # resolvers hand back the same object while their source is unchanged
+            result = self._processed[1]
+        else:
+            result = self._processor(raw)
+            self._processed = (raw, result)
+
+        if self._cache_enabled:
+            self._cached = result
+        return result
+
     def resolve(self):
         if self.resolver is None:
             raise UnassignedResolverError(f'No resolver for {self.name}')
@@ -112,33 +245,155 @@ class OptionResolver(ABC):
 
 class Config(OptionResolver):
     def __init__(self, resolvers: List[OptionResolver] = None, options: List[Option] = None, section: str = None, name=None):
+        # options indexed by (section, name)
+        self._options_by_key: Dict[Tuple, Option] = {}
+        # configs that hold this one as a resolver, notified when we change
+        self._parents = weakref.WeakSet()
+        self._flat_cache = None
+        self._options_view = None
+        # topmost option for each (section, name) looked up in our hierarchy
+        self._lookup_cache: Dict[Tuple, Optional[Option]] = {}
+        # values returned by __getitem__, keyed by option name
+        self._getitem_cache: Dict[str, Any] = {}
         # will automatically set the following section to all newly appended ConfigOptions
         self.section = section
-        self._options = set()
+        self._resolvers: Tuple[OptionResolver, ...] = ()
+        # immutable views over self.resolvers, split by kind
+        self._direct_resolvers: Tuple[DirectResolver, ...] = ()
+        self._config_resolvers: Tuple[Config, ...] = ()
         self.resolvers = resolvers or []
         self.add_options(options or [])
         self.name = name
 
     def __str__(self):
-        return self.name
+        return str(self.name)
+
+    def __getstate__(self):
+        # parent links are weak references and the caches can be rebuilt,
+        # neither is kept
+        state = self.__dict__.copy()
+        for attribute in ('_parents', '_flat_cache', '_options_view', '_lookup_cache', '_getitem_cache'):
+            del state[attribute]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._parents = weakref.WeakSet()
+        self._lookup_cache = {}
+        self._getitem_cache = {}
+        self._clear_derived()
+        for resolver in self._config_resolvers:
+            resolver._parents.add(self)
+
+    @property
+    def section(self) -> str:
+        return self._section
+
+    @section.setter
+    def section(self, section: str):
+        # __getitem__ looks options up in the default section
+        self._section = _intern(section)
+        self._hierarchy_changed()
+
+    @property
+    def resolvers(self) -> Tuple[OptionResolver, ...]:
+        # a tuple, so changes have to go through add_resolver or assignment
+        # which keep the direct/nested split up to date
+        return self._resolvers
+
+    @resolvers.setter
+    def resolvers(self, resolvers: Iterable[OptionResolver]):
+        for resolver in self._config_resolvers:
+            resolver._parents.discard(self)
+        self._resolvers = ()
+        self._direct_resolvers = ()
+        self._config_resolvers = ()
+        for resolver in resolvers:
+            self._classify(resolver)
+        self._resolvers_changed()
+
+    def add_resolver(self, resolver: OptionResolver) -> Config:
+        self._classify(resolver)
+        self._resolvers_changed()
+        return self
+
+    def _classify(self, resolver: OptionResolver):
+        self._resolvers += (resolver,)
+        if isinstance(resolver, DirectResolver):
+            self._direct_resolvers += (resolver,)
+        elif isinstance(resolver, Config):
+            self._config_resolvers += (resolver,)
+            resolver._parents.add(self)
+
+    def _resolvers_changed(self):
+        # our options are resolved only by our own direct resolvers
+        for option in self._options_by_key.values():
+            option._cached = UnsetParameter
+        self._hierarchy_changed()
+
+    def invalidate(self) -> Config:
+        # reload the resolvers and forget every cached value in our hierarchy
+        # call this after the underlying sources changed, e.g. os.environ
+        for config in self._walk():
+            for resolver in config._direct_resolvers:
+                resolver.refresh()
+            for option in config._options_by_key.values():
+                option._cached = UnsetParameter
+            config._clear_derived()
+        self._hierarchy_changed()
+        return self
 
     def add_options(self, options: List[Option]) -> Config:
         for option in options:
-            self.add_option(option)
+            self._index_option(option)
+        self._hierarchy_changed()
         return self
 
     def add_option(
             self,
             option: Option
     ) -> Config:
+        self._index_option(option)
+        self._hierarchy_changed()
+        return self
+
+    def _index_option(self, option: Option):
         if option.section is UnsetParameter:
             option.section = self.section
-        self._options.add(option.bind(self))
-        return self
+        key = (option.section, option.name)
+        if key in self._options_by_key:
+            # the option already present wins, use set_option to replace it
+            return
+        self._options_by_key[key] = option.bind(self)
+
+    def _hierarchy_changed(self):
+        # drop everything derived from our hierarchy, here and in every parent
+        pending = [self]
+        while pending:
+            config = pending.pop()
+            config._clear_derived()
+            pending.extend(config._parents)
+
+    def _clear_derived(self):
+        self._flat_cache = None
+        self._options_view = None
+        self._lookup_cache.clear()
+        self._getitem_cache.clear()
+
+    @property
+    def _options(self) -> Set[Option]:
+        return set(self._options_by_key.values())
+
+    def _owns(self, option: Option) -> bool:
+        # identity check, an equal option from another resolver does not count
+        return self._options_by_key.get((option.section, option.name)) is option
 
     @property
-    def options(self) -> Set[Option]:
-        return self._options | set()
+    def options(self) -> FrozenSet[Option]:
+        # immutable, so it is built once and shared until our options change
+        if self._options_view is None:
+            self._options_view = frozenset(self._options_by_key.values())
+        return self._options_view
 
     def __add__(self, other: OptionResolver):
 
@@ -151,29 +406,62 @@ class Config(OptionResolver):
             name=f'{self.name} + {other.name}'
         )
 
-    def get_flat(self) -> Tuple[Set, List]:
-
-        resolvers = [r for r in self.resolvers if isinstance(r, DirectResolver)]
-        options = self._options
-
-        for resolver in [r for r in self.resolvers if isinstance(r, Config)]:
-            new_options, new_resolvers = resolver.get_flat()
-            resolvers += new_resolvers
-            options |= new_options
-
-        return options, resolvers
+    def get_flat(self) -> Tuple[FrozenSet, Tuple]:
+        # the result is cached until something in our hierarchy changes
+        if self._flat_cache is not None:
+            return self._flat_cache
+
+        resolvers = []
+        options = set()
+        for config in self._walk():
+            resolvers.extend(config._direct_resolvers)
+            options.update(config._options_by_key.values())
+
+        self._flat_cache = (frozenset(options), tuple(resolvers))
+        return self._flat_cache
+
+    def _walk(self) -> Iterator[Config]:
+        # this config and every nested one, in lookup precedence order
+        # depth first, iterative so deep chains of merges cost no extra frames
+        stack = [self]
+        while stack:
+            config = stack.pop()
+            yield config
+            stack.extend(reversed(config._config_resolvers))
 
     # all children options and readers now belong to this
     def flatten(self):
-        options, resolvers = self.get_flat()
-        self._options = set([option.bind(self) for option in options])
-        self.resolvers = resolvers
+        if not self._config_resolvers:
+            # nothing nested, we are already flat
+            return
+
+        _, resolvers = self.get_flat()
+        self._options_by_key = {key: option.bind(self) for key, option in self._merged_index().items()}
+        self.resolvers = list(resolvers)
+
+    def _merged_index(self) -> Dict[Tuple, Option]:
+        # fill the index from the lowest precedence up so that
+        # shadowing options win, like they do in get_option
+        index = {}
+        for config in reversed(list(self._walk())):
+            index.update(config._options_by_key)
+        return index
+
+    def freeze(self) -> ConfigCache:
+        # resolve every option visible from this config, nested ones included,
+        # into a ConfigCache that no longer follows changes to the hierarchy
+        nested = {}
+        flat = {}
+        for key, option in self._merged_index().items():
+            nested.setdefault(option.section, {})[option.name] = flat[key] = option.read()
+        return ConfigCache(nested, section=self.section, flat=flat)
 
     def set_option(self, option: Option):
         try:
             old = self.get_option(option.name, option.section)
-            old.resolver.remove_option(old)
-            old.resolver.add_option(option)
+            owner = old.resolver
+            owner.remove_option(old)
+            owner.add_option(option)
         except UndefinedOptionError:
             self.add_option(option)
         return self
@@ -184,91 +472,168 @@ class Config(OptionResolver):
         return self
 
     def discard(self, option: Option):
-        self._options.discard(option)
-
-    def _get_option_deep(self, *args, **kwargs) -> Option:
-        # search deeper for this option
-        # only config resolvers hold options
-        for resolver in [r for r in self.resolvers if isinstance(r, Config)]:
-            try:
-                return resolver.get_option(*args, **kwargs)
-            except UndefinedOptionError:
-                pass
-        raise UndefinedOptionError
+        if self._owns(option):
+            del self._options_by_key[(option.section, option.name)]
+            # no longer indexed here, so its section and name are free to change
+            option.bind(None)
+            self._hierarchy_changed()
 
     def get_option(self, option: Union[str, Option], section: str = UnsetParameter) -> Option:
         # find the option in our resolver hierarchy
         # if multiple resolver define an option then the newly added ones have precedence
-
-        if isinstance(option, Option):
-            # when searching by instance we only return the option
-            # if the resolver is one of our children
-            if option in self._options:
-                return option
-            else:
-                return self._get_option_deep(option)
-
+        found = self._try_get_option(option, section)
+        if found is None:
+            raise UndefinedOptionError(f'Option {option} is not defined')
+        return found
+
+    def _try_get_option(self, option: Union[str, Option], section: str = UnsetParameter) -> Optional[Option]:
+        # same search as get_option but a miss returns None
+        # so that walking the hierarchy does not raise and catch on every level
+        by_instance = isinstance(option, Option)
+        if by_instance:
+            key = (option.section, option.name)
         elif isinstance(option, str):
-            # find the option locally
-            name = option
             if section is UnsetParameter:
                 # look for option in our default section
                 section = self.section
-
-            for option in self._options:
-                if option.name == name and option.section == section:
-                    return option
+            key = (section, option)
         else:
             raise ConfigError(f'Can not retrieve option {option}')
 
-        return self._get_option_deep(option, section)
+        # the topmost option is remembered until the hierarchy changes
+        found = self._lookup_cache.get(key, UnsetParameter)
+        if found is UnsetParameter:
+            found = self._lookup_cache[key] = self._find(key)
+
+        if by_instance and found is not option:
+            # when searching by instance we only return that exact option
+            # even when it is shadowed
+            return self._find(key, option)
+        return found
+
+    def _find(self, key: Tuple, instance: Option = None) -> Optional[Option]:
+        # look locally first, then deeper
+        # only config resolvers hold options
+        for config in self._walk():
+            found = config._options_by_key.get(key)
+            if found is not None and (instance is None or found is instance):
+                return found
+        return None
 
     def read(self, option: Union[str, Option], section: str = UnsetParameter) -> Any:
         # determine the value of an option only using the local readers
         # do not propagate to other BaseConfigs
         option = self.get_option(option, section)
 
-        if option not in self._options:
+        if not self._owns(option):
             raise ConfigError(f'Reader does not have option {option.name}')
 
-        if not self.resolvers:
+        if not self._resolvers:
             raise NoDirectResolversError
 
-        for reader in [rd for rd in self.resolvers if isinstance(rd, DirectResolver)]:
+        result = self._lookup(option)
+        if result is UnsetParameter:
+            raise UnassignedOptionError(f'Could not resolve {option.name}')
+        return result
+
+    def _lookup(self, option: Option) -> Any:
+        # read() for one of our own options, returning UnsetParameter on a miss
+        # a plain loop over the precomputed tuple, a next() over a generator
+        # measured several times slower for the usual handful of resolvers
+        for reader in self._direct_resolvers:
             try:
                 result = reader.read(option)
                 if result is not UnsetParameter:
                     return result
             except UnassignedOptionError:
                 continue
+        return UnsetParameter
 
-        raise UnassignedOptionError
-
-    def __getitem__(self, option: str) -> Any:
+    def __getitem__(self, option: Union[str, Option]) -> Any:
         # use this to extract options from the default section
-        return self.get_option(option).read()
+        if isinstance(option, Option):
+            # only options from our own hierarchy, like get_option
+            if self._try_get_option(option) is not option:
+                raise UndefinedOptionError(f'Option {option} is not defined')
+            return option.read()
+
+        if isinstance(option, str):
+            # anything else is left to get_option, which rejects it
+            try:
+                return self._getitem_cache[option]
+            except KeyError:
+                pass
+
+        found = self.get_option(option)
+        value = found.read()
+        if found._cache_enabled:
+            self._getitem_cache[option] = value
+        return value
 
     def cache(self) -> ConfigCache:
-        output = defaultdict(dict)
-        for option in self.options:
-            output[option.section][option.name] = option.read()
-        return ConfigCache(dict(output))
+        # same outcome as calling read() on every option, but each resolver
+        # is asked about all the unresolved options in one go
+        values = {}
+        pending = []
+        for option in self._options_by_key.values():
+            if option._cached is not UnsetParameter:
+                values[option] = option._cached
+            elif option._value is not UnsetParameter:
+                values[option] = option._finish(option._value)
+            else:
+                pending.append(option)
 
+        for reader in self._direct_resolvers:
+            if not pending:
+                break
+            found = reader.bulk_read(pending)
+            for option, raw in found.items():
+                option._resolved = raw
+                values[option] = option._finish(raw)
+            pending = [option for option in pending if option not in found]
 
-class ConfigCache:
+        for option in pending:
+            values[option] = option._read_default()
+
+        nested = {}
+        flat = {}
+        for key, option in self._options_by_key.items():
+            nested.setdefault(option.section, {})[option.name] = flat[key] = values[option]
 
-    def __init__(self, resolved_options: Dict, section=None):
-        self._index = resolved_options
+        return ConfigCache(nested, flat=flat)
+
+
+class ConfigCache:
+    __slots__ = ('_index', '_flat', 'section')
+
+    def __init__(self, resolved_options: Dict, section=None, flat: Dict[Tuple, Any] = None):
+        # same values keyed by (section, name), one probe per lookup
+        if flat is None:
+            flat = {
+                (section_name, name): value
+                for section_name, values in resolved_options.items()
+                for name, value in values.items()
+            }
+        self._flat = flat
+        # the nested view is read-only so it can not drift from the flat index
+        self._index = MappingProxyType({
+            section_name: MappingProxyType(values) for section_name, values in resolved_options.items()
+        })
         self.section = section              # Default section to retrieve from
 
+    def __reduce__(self):
+        # mapping proxies do not pickle, rebuild from plain dicts
+        nested = {section_name: dict(values) for section_name, values in self._index.items()}
+        return ConfigCache, (nested, self.section, self._flat)
+
     def __getitem__(self, name):
-        return self._index[self.section][name]
+        return self._flat[(self.section, name)]
 
-    def section(self, section):
+    def get_section(self, section):
         return self._index[section]
 
     def get(self, name, section=None):
-        return self._index[section][name]
+        return self._flat[(section, name)]
 
     @property
     def dict(self):
@@ -278,40 +643,88 @@ class ConfigCache:
 class DirectResolver(OptionResolver):
     # this will directly return the value of an option
     # from the config input
+    # failed lookups are recorded in option.attempts only while
+    # the config_savvy logger is enabled for DEBUG
     @abstractmethod
     def read(self, option: Option) -> Any:
         pass
 
+    def bulk_read(self, options: Iterable[Option]) -> Dict[Option, Any]:
+        # values for the options this resolver knows about, misses are left out
+        # override when the source can answer a batch cheaper than one by one
+        found = {}
+        for option in options:
+            try:
+                result = self.read(option)
+            except UnassignedOptionError:
+                continue
+            if result is not UnsetParameter:
+                found[option] = result
+        return found
+
+    def refresh(self):
+        # reload the underlying source, if the resolver keeps a copy of it
+        return self
+
 
 class EnvReader(DirectResolver):
 
     # get config option values from the environment
+    # the environment is copied when the reader is created,
+    # call refresh() or Config.invalidate() to pick up later changes
+    # the copy holds already decoded str keys and values, so a lookup
+    # never goes through os.environ's per-access fsdecode
     def read(self, option: Option):
-        try:
-            return os.environ[self._env_name(option.name)]
-        except KeyError:
+        env_name = self._env_name(option.name) if self._prefix else option._name_upper
+        value = self._env.get(env_name, UnsetParameter)
+        if value is UnsetParameter and LOGGER.isEnabledFor(logging.DEBUG):
             option.attempts.append(
                 f'{self} could not find value in environment'
             )
-            return UnsetParameter
+        return value
 
     def __str__(self):
         return f'{self.__class__.__name__}(prefix: {self._prefix})'
 
     def __init__(self, prefix=None):
         self._prefix = prefix or ''
+        self._env_names: Dict[str, str] = {}
+        self._env: Dict[str, str] = os.environ.copy()
+
+    def bulk_read(self, options: Iterable[Option]) -> Dict[Option, Any]:
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            # go through read() so that misses are recorded
+            return super().bulk_read(options)
+        env = self._env
+        names = (
+            (option, self._env_name(option.name) if self._prefix else option._name_upper)
+            for option in options
+        )
+        return {option: env[name] for option, name in names if name in env}
+
+    def refresh(self):
+        self._env = os.environ.copy()
+        return self
 
     def _env_name(self, name: str) -> str:
-        return (self._prefix + name).upper()
+        env_name = self._env_names.get(name)
+        if env_name is None:
+            env_name = self._env_names[name] = (self._prefix + name).upper()
+        return env_name
 
 
 class IniReader(DirectResolver):
     # get config option value from an .ini file
+
+    # parsed files shared by every reader, keyed by (path, mtime)
+    # the cached parsers are never modified
+    _PARSE_CACHE: Dict[Tuple[str, int], configparser.ConfigParser] = {}
+    # merged sections of those files, keyed by ((path, mtime), sections)
+    _LAYER_CACHE: Dict[Tuple[Tuple[str, int], Tuple[str, ...]], Tuple[Dict[str, str], Dict[str, str]]] = {}
+
     def __init__(self, filepath: str, section: str = None, sections: List[str] = None):
         self._filepath = filepath
-        with open(filepath, 'rt') as f:
-            self._config = configparser.ConfigParser()
-            self._config.read_file(f)
+        file_key, self._config = self._parse(filepath)
 
         if sections is not None:
             self._sections = sections
@@ -320,16 +733,96 @@ class IniReader(DirectResolver):
         else:
             raise ConfigError('Need to configure ONLY one of "section" or "sections"')
 
+        self._load(file_key)
+        self._keys: Dict[str, str] = {}
+
+    def refresh(self):
+        # parse the file again if it changed on disk
+        file_key, self._config = self._parse(self._filepath)
+        self._load(file_key)
+        return self
+
+    def _load(self, file_key: Tuple[str, int]):
+        layer_key = (file_key, tuple(self._sections))
+        layers = self._LAYER_CACHE.get(layer_key)
+        if layers is None:
+            layers = self._LAYER_CACHE[layer_key] = self._freeze_sections(self._config, self._sections)
+        self._merged, self._deferred = layers
+
     def __str__(self):
         return f'{self.__class__.__name__}({self._filepath})'
 
+    @classmethod
+    def _parse(cls, filepath: str) -> Tuple[Tuple[str, int], configparser.ConfigParser]:
+        path = os.path.abspath(filepath)
+        key = (path, os.stat(filepath).st_mtime_ns)
+        parser = cls._PARSE_CACHE.get(key)
+        if parser is None:
+            with open(filepath, 'rt') as f:
+                parser = configparser.ConfigParser()
+                parser.read_file(f)
+            cls._forget(path)
+            cls._PARSE_CACHE[key] = parser
+        return key, parser
+
+    @classmethod
+    def _forget(cls, path: str):
+        # drop earlier versions of a file that changed on disk
+        for key in [key for key in cls._PARSE_CACHE if key[0] == path]:
+            del cls._PARSE_CACHE[key]
+        for key in [key for key in cls._LAYER_CACHE if key[0][0] == path]:
+            del cls._LAYER_CACHE[key]
+
+    @staticmethod
+    def _freeze_sections(
+            parser: configparser.ConfigParser,
+            sections: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        # freeze the searched sections into one plain dict so reads skip the parser
+        # a section proxy also yields the DEFAULT keys
+        # earlier sections win, the same as searching them in order
+        merged: Dict[str, str] = {}
+        # keys whose value does not interpolate, mapped to their section
+        # they are left to the parser so the error is raised only when they are read
+        deferred: Dict[str, str] = {}
+        for section in reversed(sections):
+            if section != parser.default_section and not parser.has_section(section):
+                continue
+            for key in parser[section]:
+                try:
+                    merged[key] = parser.get(section, key)
+                except configparser.InterpolationError:
+                    merged.pop(key, None)
+                    deferred[key] = section
+                else:
+                    deferred.pop(key, None)
+        return merged, deferred
+
+    def _key(self, name: str) -> str:
+        # the parser normalizes option names, lowercasing them by default
+        key = self._keys.get(name)
+        if key is None:
+            key = self._keys[name] = self._config.optionxform(name)
+        return key
+
+    def bulk_read(self, options: Iterable[Option]) -> Dict[Option, Any]:
+        if self._deferred or LOGGER.isEnabledFor(logging.DEBUG):
+            # go through read() so that misses are recorded
+            # and values that do not interpolate raise
+            return super().bulk_read(options)
+        merged = self._merged
+        keys = ((option, self._key(option.name)) for option in options)
+        return {option: merged[key] for option, key in keys if key in merged}
+
     def read(self, option: Option):
-        for section in self._sections:
-            try:
-                return self._config[section][option.name]
-            except KeyError:
+        key = self._key(option.name)
+        value = self._merged.get(key, UnsetParameter)
+        if value is UnsetParameter and key in self._deferred:
+            # raises the parser's interpolation error
+            return self._config.get(self._deferred[key], key)
+        if value is UnsetParameter and LOGGER.isEnabledFor(logging.DEBUG):
+            for section in self._sections:
                 option.attempts.append(
                     f'{self} could not find value in section {section}'
                 )
-        else:
-            return UnsetParameter
+        return value
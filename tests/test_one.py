@@ -1,11 +1,15 @@
+import configparser
+import enum
+import logging
 import os
+import pickle
 
 import pytest
 
 from config_savvy import Config, EnvReader, IniReader, Option, ConfigError, UndefinedOptionError
 
 
-def test_one(caplog):
+def test_one():
     os.environ['OPTION2'] = '33'
     os.environ['OPTION3'] = 'spam'
 
@@ -87,7 +91,7 @@ def test_add_option():
     c = Config()
     c.add_option(Option('option1', 1))
     assert c.section is None
-    assert c['option1'] is 1
+    assert c['option1'] == 1
     c.section = 'SECTION1'
     c.add_option(Option('option2', 2))
     opt = c.get_option('option2', 'SECTION1')
@@ -203,11 +207,11 @@ def test_get_option():
 
     # get it by name
     opt = config1.get_option('option1')
-    assert opt.read() is 1
+    assert opt.read() == 1
 
     # get it by instance
     opt2 = config1.get_option(opt)
-    assert opt2.read() is 1
+    assert opt2.read() == 1
 
     config2 = Config(name="config2", options=[
         Option('option1', 2)
@@ -219,11 +223,11 @@ def test_get_option():
     # but when we search for an option by instance
     # we get the exact instance
     opt3 = config3.get_option(opt)
-    assert opt3.read() is 1
+    assert opt3.read() == 1
 
     # when we query by option name
     # we get the "topmost" option
-    assert config3['option1'] is 2
+    assert config3['option1'] == 2
 
 
 def test_add_remove_options():
@@ -269,4 +273,339 @@ def test_add_remove_options():
 
 def test_ini_reader():
     reader = IniReader('tests/config.ini', sections=['bitbucket.org', 'topsecret.server.com'])
-    assert reader._config.sections() == ['bitbucket.org', 'topsecret.server.com']
\ No newline at end of file
+    assert reader._config.sections() == ['bitbucket.org', 'topsecret.server.com']
+
+def test_option_read_is_cached():
+    os.environ['CACHED_OPTION'] = 'first'
+    os.environ['UNCACHED_OPTION'] = 'first'
+    reader = EnvReader()
+    config = Config(
+        options=[
+            Option('cached_option'),
+            Option('uncached_option', cache=False),
+        ],
+        resolvers=[reader]
+    )
+    assert config['cached_option'] == 'first'
+    assert config['uncached_option'] == 'first'
+
+    os.environ['CACHED_OPTION'] = 'second'
+    os.environ['UNCACHED_OPTION'] = 'second'
+    reader.refresh()
+    assert config['cached_option'] == 'first', 'Value should have been served from the cache'
+    assert config['uncached_option'] == 'second', 'Caching was disabled for this option'
+
+    config.get_option('cached_option').invalidate()
+    assert config['cached_option'] == 'second'
+
+
+def test_get_flat_is_invalidated_by_children():
+    config1 = Config(name="config1", options=[Option('option1', 1)])
+    config2 = Config(name="config2", options=[Option('option2', 2)])
+    config3 = config1 + config2
+
+    options, _ = config3.get_flat()
+    assert {o.name for o in options} == {'option1', 'option2'}
+    assert config3.get_flat() is config3.get_flat(), 'Flat view should be cached'
+
+    config1.add_option(Option('option3', 3))
+    options, _ = config3.get_flat()
+    assert {o.name for o in options} == {'option1', 'option2', 'option3'}
+
+
+def test_add_resolver():
+    os.environ['ADDED_OPTION'] = 'env'
+    config = Config(options=[Option('added_option', 'default')])
+    assert config['added_option'] == 'default'
+
+    config.add_resolver(EnvReader())
+    assert config['added_option'] == 'env', 'Adding a resolver should drop cached values'
+
+    with pytest.raises(AttributeError):
+        config.resolvers.append(EnvReader())
+
+
+def test_invalidate_merged_config():
+    os.environ['MERGED_OPTION'] = 'first'
+    config1 = Config(name="config1", options=[Option('merged_option')], resolvers=[EnvReader()])
+    config3 = Config(name="config2", options=[Option('other_option', 1)]) + config1
+
+    assert config3['merged_option'] == 'first'
+    opt = config3.get_option('merged_option')
+    assert config3[opt] == 'first'
+
+    os.environ['MERGED_OPTION'] = 'second'
+    assert config3['merged_option'] == 'first'
+
+    config3.invalidate()
+    assert config3['merged_option'] == 'second'
+    assert config1['merged_option'] == 'second'
+
+
+def test_attempts_recorded_on_debug(caplog):
+    option = Option('missing_everywhere')
+    reader = IniReader('tests/config.ini', sections=['bitbucket.org', 'topsecret.server.com'])
+
+    with caplog.at_level(logging.INFO, logger='config_savvy'):
+        reader.read(option)
+    assert option.attempts == []
+
+    with caplog.at_level(logging.DEBUG, logger='config_savvy'):
+        reader.read(option)
+    assert len(option.attempts) == 2
+
+
+def test_default_factory():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return 'lazy'
+
+    os.environ['FOUND_OPTION'] = 'env'
+    config = Config(
+        options=[
+            Option('found_option', default_factory=factory),
+            Option('lazy_option', default_factory=factory, cache=False),
+        ],
+        resolvers=[EnvReader()]
+    )
+
+    assert config['found_option'] == 'env'
+    assert calls == [], 'Factory should not run when a value was resolved'
+
+    assert config['lazy_option'] == 'lazy'
+    assert config['lazy_option'] == 'lazy'
+    assert calls == [1], 'Factory should run at most once'
+
+    with pytest.raises(ConfigError):
+        Option('option', 1, default_factory=factory)
+
+
+def test_flatten_keeps_precedence():
+    config1 = Config(name="config1", options=[Option('option1', 1), Option('option2', 2)])
+    config2 = Config(name="config2", options=[Option('option1', 'shadowed')])
+    config3 = config1 + config2
+    assert config3['option1'] == 'shadowed'
+
+    config3.flatten()
+    assert config3.resolvers == ()
+    assert {o.name for o in config3.options} == {'option1', 'option2'}
+    assert config3['option1'] == 'shadowed'
+    assert config3['option2'] == 2
+
+
+def test_deep_merge_chain():
+    base = Config(name="base", options=[Option('base_option', 'base')])
+    config = base
+    for i in range(2000):
+        config = config + Config(name=f"config{i}", options=[Option(f'option{i}', i)])
+
+    assert config['base_option'] == 'base'
+    assert config['option0'] == 0
+    options, _ = config.get_flat()
+    assert len(options) == 2001
+
+    base.add_option(Option('late_option', 'late'))
+    assert config['late_option'] == 'late'
+    config.invalidate()
+    assert config['base_option'] == 'base'
+
+
+def test_bound_option_is_frozen():
+    option = Option('option1', 1)
+    option.section = 'SECTION1'
+    config = Config(options=[option])
+
+    with pytest.raises(ConfigError):
+        option.section = 'SECTION2'
+    with pytest.raises(ConfigError):
+        option.name = 'option2'
+    assert config.get_option('option1', 'SECTION1') is option
+
+
+def test_ini_reader_reuses_parsed_file(tmp_path):
+    path = tmp_path / 'config.ini'
+    path.write_text('[section]\nkey = first\n')
+    reader1 = IniReader(str(path), section='section')
+    reader2 = IniReader(str(path), section='section')
+    assert reader1._config is reader2._config
+    assert reader1._merged is reader2._merged
+
+    stat = os.stat(path)
+    path.write_text('[section]\nkey = second\n')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    reader3 = IniReader(str(path), section='section')
+    assert reader3.read(Option('key')) == 'second', 'A modified file should be parsed again'
+    assert reader2.read(Option('key')) == 'first'
+    reader2.refresh()
+    assert reader2.read(Option('key')) == 'second'
+
+
+def test_env_reader_prefix():
+    os.environ['APP_PREFIXED'] = 'with prefix'
+    os.environ['PREFIXED'] = 'without prefix'
+    assert EnvReader('app_').read(Option('prefixed')) == 'with prefix'
+    assert EnvReader().read(Option('prefixed')) == 'without prefix'
+
+
+def test_cache_calls_are_independent():
+    config = Config(options=[Option('option1', 1)])
+    cache = config.cache()
+    cache.section = 'OTHER'
+    assert config.cache()['option1'] == 1
+
+    config.add_option(Option('option2', 2))
+    assert config.cache()['option2'] == 2
+
+
+def test_pickle_option():
+    option = Option('option1', 1, processor=int, section='SECTION1')
+    restored = pickle.loads(pickle.dumps(option))
+    assert (restored.name, restored.section) == ('option1', 'SECTION1')
+    assert hash(restored) == hash(option)
+    assert Config(options=[restored]).get_option('option1', 'SECTION1').read() == 1
+
+
+def test_pickle_bound_option():
+    os.environ['PICKLED_OPTION'] = 'env'
+    config1 = Config(name="config1", options=[Option('pickled_option')], resolvers=[EnvReader()])
+    config3 = Config(name="config2", options=[Option('other_option', 1)]) + config1
+    assert config3['pickled_option'] == 'env'
+
+    restored = pickle.loads(pickle.dumps(config3.get_option('pickled_option')))
+    assert restored.read() == 'env'
+
+    restored_config = pickle.loads(pickle.dumps(config3))
+    assert restored_config['pickled_option'] == 'env'
+    restored_child = restored_config.get_option('pickled_option').resolver
+    restored_child.add_option(Option('late_option', 'late'))
+    assert restored_config['late_option'] == 'late', 'Parent links should be rebuilt'
+
+
+def test_processor_runs_once_per_raw_value():
+    calls = []
+
+    def processor(raw):
+        calls.append(raw)
+        return int(raw)
+
+    os.environ['PROCESSED_OPTION'] = '5'
+    reader = EnvReader()
+    config = Config(options=[Option('processed_option', processor=processor, cache=False)], resolvers=[reader])
+    assert config['processed_option'] == 5
+    assert config['processed_option'] == 5
+    assert calls == ['5']
+
+    os.environ['PROCESSED_OPTION'] = '6'
+    reader.refresh()
+    assert config['processed_option'] == 6
+    assert calls == ['5', '6']
+
+
+def test_freeze():
+    config1 = Config(name="config1", options=[Option('option1', 1), Option('option2', 2)])
+    config2 = Config(name="config2", options=[Option('option1', 'shadowed')])
+    config3 = config1 + config2
+
+    frozen = config3.freeze()
+    assert frozen['option1'] == 'shadowed'
+    assert frozen['option2'] == 2
+    assert frozen.dict == {None: {'option1': 'shadowed', 'option2': 2}}
+
+    # unlike config3, the frozen view does not follow later changes
+    config1.set_option(Option('option2', 'changed'))
+    assert config3['option2'] == 'changed'
+    assert frozen['option2'] == 2
+
+
+def test_repeated_reads_return_the_same_object():
+    os.environ['BIG_NUMBER'] = '123456789'
+    config = Config(options=[Option('big_number', processor=int)], resolvers=[EnvReader()])
+    first = config['big_number']
+    assert first == 123456789
+    assert config['big_number'] is first
+    assert config.get_option('big_number').read() is first
+
+
+def test_ini_reader_defers_interpolation_errors(tmp_path):
+    path = tmp_path / 'config.ini'
+    path.write_text('[section]\nkey = ok\npw = 50%off\n')
+    reader = IniReader(str(path), section='section')
+    assert reader.read(Option('key')) == 'ok'
+
+    config = Config(options=[Option('key')], resolvers=[reader])
+    assert config.cache()['key'] == 'ok'
+
+    with pytest.raises(configparser.InterpolationError):
+        reader.read(Option('pw'))
+
+
+def test_getitem_rejects_foreign_option():
+    config1 = Config(name="config1", options=[Option('option1', 1)])
+    config2 = Config(name="config2", options=[Option('option2', 2)])
+    opt = config1.get_option('option1')
+    assert config1[opt] == 1
+
+    with pytest.raises(UndefinedOptionError):
+        config2[opt]
+
+
+def test_cache_dict_is_read_only():
+    cache = Config(options=[Option('option1', 1)]).cache()
+    with pytest.raises(TypeError):
+        cache.dict[None]['option1'] = 'changed'
+    with pytest.raises(TypeError):
+        cache.dict['other'] = {}
+    assert cache['option1'] == 1
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.get('option1') == 1
+    assert restored.dict == {None: {'option1': 1}}
+
+
+class Sec(str, enum.Enum):
+    MAIN = 'main'
+
+
+def test_str_enum_section():
+    config = Config(section=Sec.MAIN, options=[Option('option1', 1)])
+    config.add_option(Option('option2', 2, section=Sec.MAIN))
+    assert config['option1'] == 1
+    assert config.get_option('option2', 'main').read() == 2
+
+
+def test_str_enum_name():
+    os.environ['MAIN'] = 'env'
+    config = Config(options=[Option(Sec.MAIN, 1)])
+    assert config['main'] == 1
+    assert EnvReader().read(Option(Sec.MAIN)) == 'env'
+
+
+def test_duplicate_add_option_keeps_first():
+    config = Config(options=[Option('option1', 1)])
+    duplicate = Option('option1', 2)
+    config.add_option(duplicate)
+    assert config['option1'] == 1
+    assert duplicate.resolver is None
+
+    config.set_option(Option('option1', 3))
+    assert config['option1'] == 3
+
+
+def test_getitem_rejects_unhashable_key():
+    config = Config(options=[Option('a', 1)])
+    with pytest.raises(ConfigError):
+        config[['a']]
+
+
+def test_removed_option_can_be_edited():
+    option = Option('a', 1)
+    config = Config(options=[option])
+    config.remove_option('a')
+    assert option.resolver is None
+
+    option.section = 'S'
+    option.name = 'b'
+    config.add_option(option)
+    assert config.get_option('b', 'S').read() == 1